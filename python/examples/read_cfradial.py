@@ -1,22 +1,26 @@
 """Example: Reading CfRadial1 data with Python"""
 
 import radish
-import numpy as np
+
+# Single-pass, parallel NaN-aware max (numba-accelerated when installed)
+from radish.stats import nanmax
 
 # Path to your CfRadial1 file
 file_path = "path/to/cfrad.nc"
 
-# Option 1: Quick scan for metadata only
-print("Scanning file for metadata...")
-metadata = radish.scan_cfradial1(file_path)
-print(f"Instrument: {metadata.instrument_name}")
-print(f"Location: {metadata.latitude:.4f}°N, {metadata.longitude:.4f}°E, {metadata.altitude:.1f}m")
-print(f"Number of sweeps: {metadata.num_sweeps}")
-print(f"Fixed angles: {metadata.sweep_fixed_angles}")
-
-# Option 2: Read entire volume
-print("\nReading full volume...")
-volume = radish.read_cfradial1(file_path)
+# Open the file once, scan its metadata, then read the full volume.
+# (radish.scan_cfradial1 / radish.read_cfradial1 do either step on their own.)
+with radish.open_cfradial1(file_path) as f:
+    print("Scanning file for metadata...")
+    metadata = f.metadata()
+    print(f"Instrument: {metadata.instrument_name}")
+    print(f"Location: {metadata.latitude:.4f}°N, {metadata.longitude:.4f}°E, {metadata.altitude:.1f}m")
+    print(f"Number of sweeps: {metadata.num_sweeps}")
+    print(f"Fixed angles: {metadata.sweep_fixed_angles}")
+
+    print("\nReading full volume...")
+    volume = f.read()
+
 print(f"Volume has {volume.num_sweeps} sweeps")
 
 # Iterate through sweeps
@@ -32,9 +36,9 @@ for i in range(volume.num_sweeps):
         print(f"  Reflectivity shape: {dbz.shape}")
         print(f"  Units: {dbz.units}")
 
-        # Access data as numpy array
-        data = dbz.data()
-        max_val = np.nanmax(data)
+        # Access data as a zero-copy numpy view
+        data = dbz.data_view()
+        max_val = nanmax(data)
         print(f"  Max reflectivity: {max_val:.2f} dBZ")
 
 print("\n" + "="*60)
@@ -9,6 +9,9 @@ from radish._radish import (
     VolumeMetadata,
     SweepData,
     MomentData,
+    CfRadialFile,
+    open_cfradial1,
+    peek_conventions,
     read_cfradial1,
     scan_cfradial1,
 )
@@ -20,6 +23,9 @@ __all__ = [
     "VolumeMetadata",
     "SweepData",
     "MomentData",
+    "CfRadialFile",
+    "open_cfradial1",
+    "peek_conventions",
     "read_cfradial1",
     "scan_cfradial1",
 ]
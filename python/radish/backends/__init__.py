@@ -1,5 +1,5 @@
 """Backend plugins for xarray integration"""
 
-from radish.backends.xarray_backend import RadishBackendEntrypoint
+from radish.backends.xarray_backend import RadishBackendEntrypoint, clear_cache
 
-__all__ = ["RadishBackendEntrypoint"]
+__all__ = ["RadishBackendEntrypoint", "clear_cache"]
@@ -1,15 +1,19 @@
 """Xarray backend for radish"""
 
-from typing import Any, Dict, Iterable, Optional
+import functools
+import os
+import warnings
+from typing import Any, Dict, Iterable, Mapping, Optional
 import numpy as np
 
 try:
     import xarray as xr
-    from xarray.backends import BackendEntrypoint
+    from xarray.backends import BackendArray, BackendEntrypoint
     from xarray.core import indexing
     XARRAY_AVAILABLE = True
 except ImportError:
     XARRAY_AVAILABLE = False
+    BackendArray = object  # type: ignore
     BackendEntrypoint = object  # type: ignore
 
 try:
@@ -18,7 +22,154 @@ try:
 except ImportError:
     DATATREE_AVAILABLE = False
 
-from radish import read_cfradial1, VolumeData
+from radish import peek_conventions, read_cfradial1, scan_cfradial1, VolumeData
+
+# Dimensions of every moment variable
+MOMENT_DIMS = ("time", "range")
+
+# Leading bytes of netCDF-4/HDF5 and netCDF classic files
+HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+NETCDF3_SIGNATURES = (b"CDF\x01", b"CDF\x02", b"CDF\x05")
+
+# URL schemes read remotely (with HTTP byte-range requests) rather than from disk
+REMOTE_SCHEMES = ("http://", "https://")
+
+# Number of decoded volumes kept in memory when RADISH_VOLUME_CACHE_SIZE is unset
+DEFAULT_VOLUME_CACHE_SIZE = 8
+
+
+def _volume_cache_size() -> int:
+    """Volume cache size from RADISH_VOLUME_CACHE_SIZE (0 disables the cache)"""
+    value = os.environ.get("RADISH_VOLUME_CACHE_SIZE")
+    if value is None:
+        return DEFAULT_VOLUME_CACHE_SIZE
+    try:
+        return max(0, int(value))
+    except ValueError:
+        warnings.warn(
+            f"Ignoring invalid RADISH_VOLUME_CACHE_SIZE={value!r}, "
+            f"using {DEFAULT_VOLUME_CACHE_SIZE}",
+            RuntimeWarning,
+        )
+        return DEFAULT_VOLUME_CACHE_SIZE
+
+
+# Number of decoded volumes kept in memory (0 disables the cache)
+VOLUME_CACHE_SIZE = _volume_cache_size()
+
+
+@functools.lru_cache(maxsize=VOLUME_CACHE_SIZE)
+def _cached_volume(path: str, mtime: int, size: int, **kwargs) -> VolumeData:
+    """Read a volume; mtime and size invalidate the entry when the file changes"""
+    return read_cfradial1(path, **kwargs)
+
+
+def clear_cache() -> None:
+    """Drop every volume held in the xarray backend's volume cache"""
+    _cached_volume.cache_clear()
+
+
+def _chunk_cache_kwargs(
+    chunk_cache_bytes: Optional[int] = None,
+    chunk_cache_slots: Optional[int] = None,
+    chunk_cache_w0: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Chunk cache arguments for radish readers; unset ones keep the reader defaults"""
+    chunk_cache = {
+        "chunk_cache_bytes": chunk_cache_bytes,
+        "chunk_cache_slots": chunk_cache_slots,
+        "chunk_cache_w0": chunk_cache_w0,
+    }
+    return {key: value for key, value in chunk_cache.items() if value is not None}
+
+
+def _decoder_kwargs(
+    mask_and_scale: bool = True,
+    decode_times: bool = True,
+    concat_characters: bool = True,
+    decode_coords: bool = True,
+    use_cftime: Optional[bool] = None,
+    decode_timedelta: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """CF decoding options for xarray.decode_cf"""
+    return {
+        "mask_and_scale": mask_and_scale,
+        "decode_times": decode_times,
+        "concat_characters": concat_characters,
+        "decode_coords": decode_coords,
+        "use_cftime": use_cftime,
+        "decode_timedelta": decode_timedelta,
+    }
+
+
+def _normalize_path(filename_or_obj) -> str:
+    """Absolute path of a local file, or a remote URL passed through unchanged"""
+    path = os.fspath(filename_or_obj)
+    if path.startswith(REMOTE_SCHEMES):
+        return path
+    return os.path.abspath(path)
+
+
+def _has_netcdf_signature(path: str) -> bool:
+    """Whether a local file starts with a netCDF-4/HDF5 or netCDF classic signature"""
+    try:
+        with open(path, "rb") as f:
+            signature = f.read(8)
+    except OSError:
+        return False
+    return signature == HDF5_SIGNATURE or signature.startswith(NETCDF3_SIGNATURES)
+
+
+def _read_volume(filename_or_obj, **kwargs) -> VolumeData:
+    """Read a volume, through the in-memory volume cache for local files"""
+    path = _normalize_path(filename_or_obj)
+    if path.startswith(REMOTE_SCHEMES):
+        return read_cfradial1(path, **kwargs)
+
+    st = os.stat(path)
+    return _cached_volume(path, st.st_mtime_ns, st.st_size, **kwargs)
+
+
+class RadishBackendArray(BackendArray):
+    """
+    Lazily indexed view of a single moment.
+
+    xarray only indexes into the moment when values are requested, so
+    slicing a sweep never copies more than the selected region.
+    """
+
+    def __init__(self, array):
+        self.array = array
+        self.shape = array.shape
+        self.dtype = array.dtype
+
+    def __getitem__(self, key):
+        return indexing.explicit_indexing_adapter(
+            key,
+            self.shape,
+            indexing.IndexingSupport.BASIC,
+            self._raw_getitem,
+        )
+
+    def _raw_getitem(self, key):
+        # The moment is a read-only view that may be shared through the volume
+        # cache; copy just the indexed region so users get a writable array
+        return np.array(self.array[key])
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.array, dtype=dtype)
+
+
+def _moment_attrs(moment) -> Dict[str, Any]:
+    """CF attributes of a moment, including the packing needed by decode_cf"""
+    attrs = {"units": moment.units}
+    if moment.scale_factor is not None:
+        attrs["scale_factor"] = np.float32(moment.scale_factor)
+    if moment.add_offset is not None:
+        attrs["add_offset"] = np.float32(moment.add_offset)
+    if moment.fill_value is not None:
+        attrs["_FillValue"] = np.float32(moment.fill_value)
+    return attrs
 
 
 class RadishBackendEntrypoint(BackendEntrypoint):
@@ -26,27 +177,88 @@ class RadishBackendEntrypoint(BackendEntrypoint):
 
     description = "Read weather radar data files using the radish library"
     url = "https://github.com/mgrover1/radish"
+    open_dataset_parameters = (
+        "filename_or_obj",
+        "drop_variables",
+        "mask_and_scale",
+        "decode_times",
+        "concat_characters",
+        "decode_coords",
+        "use_cftime",
+        "decode_timedelta",
+        "chunk_cache_bytes",
+        "chunk_cache_slots",
+        "chunk_cache_w0",
+        "metadata_only",
+    )
 
     def open_dataset(
         self,
         filename_or_obj,
         *,
         drop_variables: Optional[Iterable[str]] = None,
+        mask_and_scale: bool = True,
+        decode_times: bool = True,
+        concat_characters: bool = True,
+        decode_coords: bool = True,
+        use_cftime: Optional[bool] = None,
+        decode_timedelta: Optional[bool] = None,
+        chunk_cache_bytes: Optional[int] = None,
+        chunk_cache_slots: Optional[int] = None,
+        chunk_cache_w0: Optional[float] = None,
+        metadata_only: bool = False,
         **kwargs
     ):
         """
         Open a single dataset (sweep).
 
         For multi-sweep files, use open_datatree instead.
+
+        Moments advertise whole rays (the full ``range`` dimension) as their
+        preferred chunks, which xarray uses when ``chunks=`` is passed to
+        ``xr.open_dataset``.
+
+        ``mask_and_scale``, ``decode_times`` and the other CF decoding
+        options are passed to ``xarray.decode_cf``; with
+        ``mask_and_scale=False`` the moments keep their packed values.
+
+        ``chunk_cache_bytes``, ``chunk_cache_slots`` and ``chunk_cache_w0``
+        tune the HDF5 chunk cache, see ``radish.read_cfradial1``.
+
+        With ``metadata_only=True`` only the volume metadata is scanned and
+        no moments are read. The result is the volume-level dataset (the
+        DataTree root) with an empty ``("time", "range")`` placeholder
+        variable for each moment, so the schema can be inspected cheaply.
         """
+        chunk_cache = _chunk_cache_kwargs(chunk_cache_bytes, chunk_cache_slots, chunk_cache_w0)
+        decoders = _decoder_kwargs(
+            mask_and_scale,
+            decode_times,
+            concat_characters,
+            decode_coords,
+            use_cftime,
+            decode_timedelta,
+        )
+        drop_variables = set(drop_variables or ())
+
+        # Metadata-only fast path
+        if metadata_only:
+            metadata = scan_cfradial1(_normalize_path(filename_or_obj), **chunk_cache)
+            return self._create_metadata_dataset(metadata, drop_variables)
+
         # Read the volume
-        volume = read_cfradial1(str(filename_or_obj))
+        volume = _read_volume(filename_or_obj, **chunk_cache)
 
         # Get the first sweep
         sweep = volume.get_sweep(0)
 
         # Convert to xarray Dataset
-        dataset = self._sweep_to_dataset(sweep, volume.metadata)
+        dataset = self._sweep_to_dataset(
+            sweep,
+            volume.metadata.instrument_name,
+            drop_variables=drop_variables,
+            decoders=decoders,
+        )
 
         return dataset
 
@@ -55,6 +267,15 @@ class RadishBackendEntrypoint(BackendEntrypoint):
         filename_or_obj,
         *,
         drop_variables: Optional[Iterable[str]] = None,
+        mask_and_scale: bool = True,
+        decode_times: bool = True,
+        concat_characters: bool = True,
+        decode_coords: bool = True,
+        use_cftime: Optional[bool] = None,
+        decode_timedelta: Optional[bool] = None,
+        chunk_cache_bytes: Optional[int] = None,
+        chunk_cache_slots: Optional[int] = None,
+        chunk_cache_w0: Optional[float] = None,
         **kwargs
     ):
         """
@@ -63,6 +284,9 @@ class RadishBackendEntrypoint(BackendEntrypoint):
         Returns a DataTree with:
         - Root group: volume metadata
         - sweep_N groups: individual sweep data
+
+        The decoding options and the chunk cache settings behave as in
+        ``open_dataset``.
         """
         if not DATATREE_AVAILABLE:
             raise ImportError(
@@ -71,24 +295,51 @@ class RadishBackendEntrypoint(BackendEntrypoint):
             )
 
         # Read the volume
-        volume = read_cfradial1(str(filename_or_obj))
+        chunk_cache = _chunk_cache_kwargs(chunk_cache_bytes, chunk_cache_slots, chunk_cache_w0)
+        decoders = _decoder_kwargs(
+            mask_and_scale,
+            decode_times,
+            concat_characters,
+            decode_coords,
+            use_cftime,
+            decode_timedelta,
+        )
+        volume = _read_volume(filename_or_obj, **chunk_cache)
+        drop_variables = set(drop_variables or ())
 
         # Create datasets for each sweep
         datasets = {}
+        metadata = volume.metadata
+        instrument_name = metadata.instrument_name
 
         # Root dataset with volume metadata
-        root_ds = self._create_root_dataset(volume.metadata)
+        root_ds = self._create_root_dataset(metadata)
         datasets["/"] = root_ds
 
         # Sweep datasets
         for i in range(volume.num_sweeps):
-            sweep = volume.get_sweep(i)
-            sweep_ds = self._sweep_to_dataset(sweep, volume.metadata)
-            datasets[f"/sweep_{i}"] = sweep_ds
+            datasets[f"/sweep_{i}"] = self._sweep_to_dataset(
+                volume.get_sweep(i),
+                instrument_name,
+                drop_variables=drop_variables,
+                decoders=decoders,
+            )
 
         # Create DataTree
         return DataTree.from_dict(datasets)
 
+    def _create_metadata_dataset(
+        self, metadata, drop_variables: Iterable[str] = ()
+    ) -> "xr.Dataset":
+        """Root dataset plus an empty placeholder variable for each moment"""
+        dataset = self._create_root_dataset(metadata)
+        placeholders = {
+            name: xr.Variable(MOMENT_DIMS, np.empty((0, 0), dtype=np.float32))
+            for name in metadata.moment_names
+            if name not in drop_variables
+        }
+        return dataset.assign(placeholders)
+
     def _create_root_dataset(self, metadata) -> "xr.Dataset":
         """Create root dataset with volume metadata"""
         coords = {
@@ -98,7 +349,7 @@ class RadishBackendEntrypoint(BackendEntrypoint):
         }
 
         data_vars = {
-            "sweep_fixed_angle": (["sweep"], np.array(metadata.sweep_fixed_angles)),
+            "sweep_fixed_angle": (["sweep"], metadata.sweep_fixed_angles),
         }
 
         attrs = {
@@ -108,9 +359,15 @@ class RadishBackendEntrypoint(BackendEntrypoint):
 
         return xr.Dataset(data_vars=data_vars, coords=coords, attrs=attrs)
 
-    def _sweep_to_dataset(self, sweep, volume_metadata) -> "xr.Dataset":
+    def _sweep_to_dataset(
+        self,
+        sweep,
+        instrument_name: str,
+        drop_variables: Iterable[str] = (),
+        decoders: Optional[Mapping[str, Any]] = None,
+    ) -> "xr.Dataset":
         """Convert a sweep to an xarray Dataset"""
-        # Coordinates
+        # Coordinates, copied out of the read-only views (one value per ray/gate)
         coords = {
             "azimuth": (["time"], np.array(sweep.azimuth)),
             "elevation": (["time"], np.array(sweep.elevation)),
@@ -119,36 +376,45 @@ class RadishBackendEntrypoint(BackendEntrypoint):
 
         # Data variables (moments)
         data_vars = {}
-        for moment_name in sweep.moment_names():
-            moment = sweep.get_moment(moment_name)
-            if moment is not None:
-                data_vars[moment_name] = (
-                    ["time", "range"],
-                    moment.data(),
-                    {"units": moment.units}
-                )
+        for moment_name, moment in sweep.iter_moments():
+            if moment_name in drop_variables:
+                continue
+            data = indexing.LazilyIndexedArray(RadishBackendArray(moment.data_view()))
+            # Rays are contiguous, so dask chunks should only split along time
+            encoding = {"preferred_chunks": {"range": data.shape[1]}}
+            data_vars[moment_name] = xr.Variable(
+                MOMENT_DIMS, data, _moment_attrs(moment), encoding
+            )
 
         # Attributes
         attrs = {
-            "sweep_number": int(sweep.sweep_number),
-            "fixed_angle": float(sweep.fixed_angle),
-            "instrument_name": volume_metadata.instrument_name,
+            "sweep_number": sweep.sweep_number,
+            "fixed_angle": sweep.fixed_angle,
+            "instrument_name": instrument_name,
         }
 
-        return xr.Dataset(data_vars=data_vars, coords=coords, attrs=attrs)
+        # Moments stay packed; decode_cf masks and scales them lazily
+        dataset = xr.Dataset(data_vars=data_vars, coords=coords, attrs=attrs)
+        return xr.decode_cf(dataset, **(decoders or {}))
 
     @classmethod
     def guess_can_open(cls, filename_or_obj):
-        """Guess if the file can be opened by this backend"""
-        try:
-            path = str(filename_or_obj)
-            # Check file extension
-            if path.endswith((".nc", ".nc4", ".netcdf")):
-                # Could do more sophisticated checking here
-                return True
-        except (TypeError, AttributeError):
-            pass
-        return False
+        """Guess if the file is a CfRadial file, without fully opening it"""
+        if not isinstance(filename_or_obj, (str, os.PathLike)):
+            return False
+        path = _normalize_path(filename_or_obj)
+
+        # Never touch the network while guessing; pass engine="radish" for URLs
+        if path.startswith(REMOTE_SCHEMES):
+            return False
+
+        # Reject files that are not netCDF from their signature
+        if not _has_netcdf_signature(path):
+            return False
+
+        # Only claim netCDF files following the CF/Radial conventions
+        conventions = peek_conventions(path)
+        return conventions is not None and "radial" in conventions.lower()
 
 
 # For backwards compatibility
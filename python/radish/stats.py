@@ -0,0 +1,86 @@
+"""
+NaN-aware reductions over moment data
+
+With numba installed these fuse the NaN check and the reduction into a single
+parallel pass over the buffer. Without it they fall back to NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+__all__ = ["nanmax", "nanmin", "nanmean"]
+
+# Fast-math flags that keep NaN semantics; "nnan" would let LLVM drop the isnan checks
+_FASTMATH = {"reassoc", "contract", "arcp", "nsz"}
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=_FASTMATH)
+    def _nanmax(values):
+        result = -np.inf
+        count = 0
+        for i in prange(values.size):
+            v = values[i]
+            if not np.isnan(v):
+                result = max(result, v)
+                count += 1
+        return result if count > 0 else np.nan
+
+    @njit(parallel=True, fastmath=_FASTMATH)
+    def _nanmin(values):
+        result = np.inf
+        count = 0
+        for i in prange(values.size):
+            v = values[i]
+            if not np.isnan(v):
+                result = min(result, v)
+                count += 1
+        return result if count > 0 else np.nan
+
+    @njit(parallel=True, fastmath=_FASTMATH)
+    def _nanmean(values):
+        total = 0.0
+        count = 0
+        for i in prange(values.size):
+            v = values[i]
+            if not np.isnan(v):
+                total += v
+                count += 1
+        return total / count if count > 0 else np.nan
+
+else:
+
+    def _all_nan(values) -> bool:
+        # NumPy raises on empty input to nanmax/nanmin and warns on all-NaN
+        # input; match the numba kernels and return NaN quietly instead
+        return values.size == 0 or bool(np.isnan(values).all())
+
+    def _nanmax(values):
+        return np.nan if _all_nan(values) else np.nanmax(values)
+
+    def _nanmin(values):
+        return np.nan if _all_nan(values) else np.nanmin(values)
+
+    def _nanmean(values):
+        return np.nan if _all_nan(values) else np.nanmean(values)
+
+
+def nanmax(a) -> float:
+    """Maximum of ``a`` ignoring NaNs (NaN if ``a`` is empty or all NaN)"""
+    return float(_nanmax(np.ravel(a)))
+
+
+def nanmin(a) -> float:
+    """Minimum of ``a`` ignoring NaNs (NaN if ``a`` is empty or all NaN)"""
+    return float(_nanmin(np.ravel(a)))
+
+
+def nanmean(a) -> float:
+    """Mean of ``a`` ignoring NaNs (NaN if ``a`` is empty or all NaN)"""
+    return float(_nanmean(np.ravel(a)))
@@ -1,13 +1,16 @@
 /// Python bindings for radish
 
 use pyo3::prelude::*;
-use pyo3::exceptions::PyRuntimeError;
-use numpy::{PyArray2, ToPyArray};
-use ndarray::Array2;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::types::{IntoPyDict, PyDict};
+use numpy::{IntoPyArray, PyArray1, PyArray2, PyReadwriteArray2, ToPyArray};
+use ndarray::ArrayView1;
 use std::path::PathBuf;
+use std::sync::Arc;
 
 use radish::{
     backends::{RadarBackend, CfRadial1Backend},
+    io::{self, ChunkCacheConfig, read_string_attribute},
     VolumeData as RustVolumeData,
     VolumeMetadata as RustVolumeMetadata,
     SweepData as RustSweepData,
@@ -44,8 +47,8 @@ impl PyVolumeMetadata {
     }
 
     #[getter]
-    fn sweep_fixed_angles(&self) -> Vec<f64> {
-        self.inner.sweep_fixed_angles.clone()
+    fn sweep_fixed_angles<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f64>> {
+        PyArray1::from_slice_bound(py, &self.inner.sweep_fixed_angles)
     }
 
     #[getter]
@@ -53,6 +56,11 @@ impl PyVolumeMetadata {
         self.inner.sweep_group_names.len()
     }
 
+    #[getter]
+    fn moment_names(&self) -> Vec<String> {
+        self.inner.moment_names.clone()
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "VolumeMetadata(instrument='{}', lat={:.4}, lon={:.4}, alt={:.1}, sweeps={})",
@@ -67,8 +75,9 @@ impl PyVolumeMetadata {
 
 /// Python wrapper for MomentData
 #[pyclass(name = "MomentData")]
+#[derive(Clone)]
 pub struct PyMomentData {
-    inner: RustMomentData,
+    inner: Arc<RustMomentData>,
 }
 
 #[pymethods]
@@ -88,10 +97,91 @@ impl PyMomentData {
         self.inner.shape()
     }
 
+    #[getter]
+    fn scale_factor(&self) -> Option<f32> {
+        self.inner.scale_factor
+    }
+
+    #[getter]
+    fn add_offset(&self) -> Option<f32> {
+        self.inner.add_offset
+    }
+
+    #[getter]
+    fn fill_value(&self) -> Option<f32> {
+        self.inner.fill_value
+    }
+
+    /// Whether the data holds packed values that need scale_factor/add_offset applied
+    #[getter]
+    fn is_packed(&self) -> bool {
+        self.inner.scale_factor.is_some() || self.inner.add_offset.is_some()
+    }
+
+    /// Packed data as int16, as stored on disk
+    ///
+    /// Raises ValueError for moments packed into anything other than int16,
+    /// rather than silently clipping their values.
+    fn raw_data<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<i16>>> {
+        if !self.is_packed() {
+            return Err(PyValueError::new_err(format!(
+                "Moment '{}' is not packed",
+                self.inner.name
+            )));
+        }
+
+        let raw = py.allow_threads(|| {
+            let fits_i16 = self.inner.data.iter().all(|&v| {
+                v.fract() == 0.0 && v >= i16::MIN as f32 && v <= i16::MAX as f32
+            });
+            fits_i16.then(|| self.inner.data.mapv(|v| v as i16))
+        });
+
+        match raw {
+            Some(raw) => Ok(raw.into_pyarray_bound(py)),
+            None => Err(PyValueError::new_err(format!(
+                "Moment '{}' is not packed as int16",
+                self.inner.name
+            ))),
+        }
+    }
+
     fn data<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f32>>> {
         Ok(self.inner.data.to_pyarray_bound(py))
     }
 
+    /// Copy the data into an existing float32 array of the same shape
+    ///
+    /// Lets callers fill slices of one preallocated buffer instead of
+    /// allocating a new array per moment.
+    fn data_into(&self, mut out: PyReadwriteArray2<'_, f32>) -> PyResult<()> {
+        let mut out = out.as_array_mut();
+        if out.dim() != self.inner.data.dim() {
+            return Err(PyValueError::new_err(format!(
+                "Output shape {:?} does not match moment shape {:?}",
+                out.dim(),
+                self.inner.data.dim()
+            )));
+        }
+
+        out.assign(&self.inner.data);
+        Ok(())
+    }
+
+    /// Read-only NumPy view of the data without copying
+    ///
+    /// The view keeps this MomentData alive for as long as it exists.
+    fn data_view<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        let py = slf.py();
+        // Safety: the moment data is never mutated after loading and the
+        // container keeps the owning Arc alive.
+        let view = unsafe {
+            PyArray2::borrow_from_array_bound(&slf.borrow().inner.data, slf.clone().into_any())
+        };
+        set_readonly(py, view.as_any())?;
+        Ok(view)
+    }
+
     fn __repr__(&self) -> String {
         let (nrays, ngates) = self.shape();
         format!(
@@ -108,6 +198,21 @@ impl PyMomentData {
 #[pyclass(name = "SweepData")]
 pub struct PySweepData {
     inner: RustSweepData,
+    /// Moments sorted by name, shared with every MomentData handed out
+    moments: Vec<(String, Arc<RustMomentData>)>,
+}
+
+impl From<RustSweepData> for PySweepData {
+    fn from(mut inner: RustSweepData) -> Self {
+        let mut moments: Vec<_> = inner
+            .moments
+            .drain()
+            .map(|(name, moment)| (name, Arc::new(moment)))
+            .collect();
+        moments.sort_by(|a, b| a.0.cmp(&b.0));
+
+        Self { inner, moments }
+    }
 }
 
 #[pymethods]
@@ -133,28 +238,51 @@ impl PySweepData {
     }
 
     fn moment_names(&self) -> Vec<String> {
-        self.inner.moment_names().into_iter().cloned().collect()
+        self.moments.iter().map(|(name, _)| name.clone()).collect()
     }
 
     fn get_moment(&self, name: &str) -> Option<PyMomentData> {
-        self.inner.get_moment(name).map(|m| PyMomentData {
-            inner: m.clone(),
-        })
+        self.moments
+            .iter()
+            .find(|(n, _)| n == name)
+            .map(|(_, m)| PyMomentData { inner: Arc::clone(m) })
+    }
+
+    /// All moments as a list of (name, MomentData) pairs, sorted by name
+    ///
+    /// No moment data is copied; use MomentData.data_view() for zero-copy access.
+    fn iter_moments(&self) -> Vec<(String, PyMomentData)> {
+        self.moments
+            .iter()
+            .map(|(name, m)| (name.clone(), PyMomentData { inner: Arc::clone(m) }))
+            .collect()
+    }
+
+    /// All moments as a dict of name -> (data, units)
+    ///
+    /// The copying counterpart of iter_moments: every array is a fresh,
+    /// writable copy owned by NumPy.
+    fn moments_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new_bound(py);
+        for (name, m) in &self.moments {
+            dict.set_item(name, (m.data.to_pyarray_bound(py), m.units.clone()))?;
+        }
+        Ok(dict)
     }
 
     #[getter]
-    fn azimuth(&self) -> Vec<f32> {
-        self.inner.coordinates.azimuth.clone()
+    fn azimuth<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray1<f32>>> {
+        coordinate_view(slf, &slf.borrow().inner.coordinates.azimuth)
     }
 
     #[getter]
-    fn elevation(&self) -> Vec<f32> {
-        self.inner.coordinates.elevation.clone()
+    fn elevation<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray1<f32>>> {
+        coordinate_view(slf, &slf.borrow().inner.coordinates.elevation)
     }
 
     #[getter]
-    fn range(&self) -> Vec<f32> {
-        self.inner.coordinates.range.clone()
+    fn range<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray1<f32>>> {
+        coordinate_view(slf, &slf.borrow().inner.coordinates.range)
     }
 
     fn __repr__(&self) -> String {
@@ -164,15 +292,54 @@ impl PySweepData {
             self.fixed_angle(),
             self.num_rays(),
             self.num_gates(),
-            self.inner.moments.len()
+            self.moments.len()
         )
     }
 }
 
+/// Read-only NumPy view of a sweep coordinate without copying
+///
+/// The view keeps the sweep alive for as long as it exists.
+fn coordinate_view<'py>(
+    sweep: &Bound<'py, PySweepData>,
+    values: &[f32],
+) -> PyResult<Bound<'py, PyArray1<f32>>> {
+    // Safety: sweep coordinates are never mutated after loading and the
+    // container keeps the owning sweep alive.
+    let view = unsafe {
+        PyArray1::borrow_from_array_bound(&ArrayView1::from(values), sweep.clone().into_any())
+    };
+    set_readonly(sweep.py(), view.as_any())?;
+    Ok(view)
+}
+
+/// Mark a NumPy array borrowing Rust-owned data as read-only
+fn set_readonly(py: Python<'_>, array: &Bound<'_, PyAny>) -> PyResult<()> {
+    array.call_method("setflags", (), Some(&[("write", false)].into_py_dict_bound(py)))?;
+    Ok(())
+}
+
 /// Python wrapper for VolumeData
 #[pyclass(name = "VolumeData")]
 pub struct PyVolumeData {
-    inner: RustVolumeData,
+    metadata: RustVolumeMetadata,
+    /// Sweeps wrapped once at load so get_sweep does not copy them
+    sweeps: Vec<Py<PySweepData>>,
+}
+
+impl PyVolumeData {
+    fn new(py: Python<'_>, volume: RustVolumeData) -> PyResult<Self> {
+        let sweeps = volume
+            .sweeps
+            .into_iter()
+            .map(|sweep| Py::new(py, PySweepData::from(sweep)))
+            .collect::<PyResult<Vec<_>>>()?;
+
+        Ok(Self {
+            metadata: volume.metadata,
+            sweeps,
+        })
+    }
 }
 
 #[pymethods]
@@ -180,57 +347,212 @@ impl PyVolumeData {
     #[getter]
     fn metadata(&self) -> PyVolumeMetadata {
         PyVolumeMetadata {
-            inner: self.inner.metadata.clone(),
+            inner: self.metadata.clone(),
         }
     }
 
     #[getter]
     fn num_sweeps(&self) -> usize {
-        self.inner.num_sweeps()
+        self.sweeps.len()
     }
 
-    fn get_sweep(&self, index: usize) -> PyResult<PySweepData> {
-        self.inner
-            .get_sweep(index)
-            .map(|s| PySweepData {
-                inner: s.clone(),
-            })
+    fn get_sweep(&self, py: Python<'_>, index: usize) -> PyResult<Py<PySweepData>> {
+        self.sweeps
+            .get(index)
+            .map(|s| s.clone_ref(py))
             .ok_or_else(|| PyRuntimeError::new_err(format!("Invalid sweep index: {}", index)))
     }
 
     fn __repr__(&self) -> String {
         format!(
             "VolumeData(instrument='{}', sweeps={})",
-            self.inner.metadata.instrument_name,
+            self.metadata.instrument_name,
             self.num_sweeps()
         )
     }
 }
 
+/// Python wrapper for an open CfRadial1 file
+///
+/// Opening once lets callers scan the metadata and then read the volume
+/// without reopening the file or re-parsing its header.
+#[pyclass(name = "CfRadialFile")]
+pub struct PyCfRadialFile {
+    backend: CfRadial1Backend,
+    file: Option<netcdf::File>,
+    /// Metadata read on first use and reused by read()
+    metadata: Option<RustVolumeMetadata>,
+}
+
+impl PyCfRadialFile {
+    fn file(&self) -> PyResult<&netcdf::File> {
+        self.file
+            .as_ref()
+            .ok_or_else(|| PyValueError::new_err("I/O operation on closed file"))
+    }
+
+    fn load_metadata(&mut self, py: Python<'_>) -> PyResult<RustVolumeMetadata> {
+        if let Some(metadata) = &self.metadata {
+            return Ok(metadata.clone());
+        }
+
+        let file = self.file()?;
+        let backend = &self.backend;
+        let metadata = py
+            .allow_threads(|| backend.read_volume_metadata(file))
+            .map_err(|e| PyRuntimeError::new_err(format!("Failed to scan file: {}", e)))?;
+
+        self.metadata = Some(metadata.clone());
+        Ok(metadata)
+    }
+}
+
+#[pymethods]
+impl PyCfRadialFile {
+    /// Volume metadata, without reading any sweeps
+    fn metadata(&mut self, py: Python<'_>) -> PyResult<PyVolumeMetadata> {
+        Ok(PyVolumeMetadata {
+            inner: self.load_metadata(py)?,
+        })
+    }
+
+    /// Read the entire volume
+    fn read(&mut self, py: Python<'_>) -> PyResult<PyVolumeData> {
+        let metadata = self.load_metadata(py)?;
+        let file = self.file()?;
+        let backend = &self.backend;
+
+        let volume = py
+            .allow_threads(|| backend.read_volume_with_metadata(file, metadata))
+            .map_err(|e| PyRuntimeError::new_err(format!("Failed to read file: {}", e)))?;
+
+        PyVolumeData::new(py, volume)
+    }
+
+    fn close(&mut self) {
+        self.file = None;
+    }
+
+    #[getter]
+    fn closed(&self) -> bool {
+        self.file.is_none()
+    }
+
+    fn __enter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __exit__(
+        &mut self,
+        _exc_type: &Bound<'_, PyAny>,
+        _exc_value: &Bound<'_, PyAny>,
+        _traceback: &Bound<'_, PyAny>,
+    ) -> bool {
+        self.close();
+        false
+    }
+
+    fn __repr__(&self) -> String {
+        format!("CfRadialFile(closed={})", self.closed())
+    }
+}
+
+/// Build a CfRadial1 backend with the given HDF5 chunk cache settings
+fn cfradial1_backend(nbytes: usize, nslots: usize, w0: f32) -> CfRadial1Backend {
+    CfRadial1Backend::new().with_chunk_cache(ChunkCacheConfig { nbytes, nslots, w0 })
+}
+
 /// Read a CfRadial1 file
+///
+/// The GIL is released while the file is read, so other Python threads
+/// keep running.
 #[pyfunction]
-fn read_cfradial1(path: String) -> PyResult<PyVolumeData> {
-    let backend = CfRadial1Backend::new();
-    let path = PathBuf::from(path);
-
-    backend
-        .read_volume(&path)
-        .map(|volume| PyVolumeData { inner: volume })
-        .map_err(|e| PyRuntimeError::new_err(format!("Failed to read file: {}", e)))
+#[pyo3(signature = (
+    path,
+    *,
+    chunk_cache_bytes = ChunkCacheConfig::default().nbytes,
+    chunk_cache_slots = ChunkCacheConfig::default().nslots,
+    chunk_cache_w0 = ChunkCacheConfig::default().w0,
+))]
+fn read_cfradial1(
+    py: Python<'_>,
+    path: PathBuf,
+    chunk_cache_bytes: usize,
+    chunk_cache_slots: usize,
+    chunk_cache_w0: f32,
+) -> PyResult<PyVolumeData> {
+    let backend = cfradial1_backend(chunk_cache_bytes, chunk_cache_slots, chunk_cache_w0);
+
+    let volume = py
+        .allow_threads(|| backend.read_volume(&path))
+        .map_err(|e| PyRuntimeError::new_err(format!("Failed to read file: {}", e)))?;
+
+    PyVolumeData::new(py, volume)
 }
 
 /// Scan a CfRadial1 file for metadata only
 #[pyfunction]
-fn scan_cfradial1(path: String) -> PyResult<PyVolumeMetadata> {
-    let backend = CfRadial1Backend::new();
-    let path = PathBuf::from(path);
-
-    backend
-        .scan_file(&path)
+#[pyo3(signature = (
+    path,
+    *,
+    chunk_cache_bytes = ChunkCacheConfig::default().nbytes,
+    chunk_cache_slots = ChunkCacheConfig::default().nslots,
+    chunk_cache_w0 = ChunkCacheConfig::default().w0,
+))]
+fn scan_cfradial1(
+    py: Python<'_>,
+    path: PathBuf,
+    chunk_cache_bytes: usize,
+    chunk_cache_slots: usize,
+    chunk_cache_w0: f32,
+) -> PyResult<PyVolumeMetadata> {
+    let backend = cfradial1_backend(chunk_cache_bytes, chunk_cache_slots, chunk_cache_w0);
+
+    py.allow_threads(|| backend.scan_file(&path))
         .map(|metadata| PyVolumeMetadata { inner: metadata })
         .map_err(|e| PyRuntimeError::new_err(format!("Failed to scan file: {}", e)))
 }
 
+/// Open a CfRadial1 file for scanning and reading
+#[pyfunction]
+#[pyo3(signature = (
+    path,
+    *,
+    chunk_cache_bytes = ChunkCacheConfig::default().nbytes,
+    chunk_cache_slots = ChunkCacheConfig::default().nslots,
+    chunk_cache_w0 = ChunkCacheConfig::default().w0,
+))]
+fn open_cfradial1(
+    py: Python<'_>,
+    path: PathBuf,
+    chunk_cache_bytes: usize,
+    chunk_cache_slots: usize,
+    chunk_cache_w0: f32,
+) -> PyResult<PyCfRadialFile> {
+    let backend = cfradial1_backend(chunk_cache_bytes, chunk_cache_slots, chunk_cache_w0);
+
+    let file = py
+        .allow_threads(|| backend.open_file(&path))
+        .map_err(|e| PyRuntimeError::new_err(format!("Failed to open file: {}", e)))?;
+
+    Ok(PyCfRadialFile {
+        backend,
+        file: Some(file),
+        metadata: None,
+    })
+}
+
+/// Read the global Conventions attribute of a NetCDF file, if present
+///
+/// Cheap check used to tell CfRadial files apart from other NetCDF files.
+#[pyfunction]
+fn peek_conventions(py: Python<'_>, path: PathBuf) -> Option<String> {
+    py.allow_threads(|| {
+        let file = io::open(&path).ok()?;
+        read_string_attribute(file.attributes(), "Conventions")
+    })
+}
+
 /// Python module
 #[pymodule]
 fn _radish(m: &Bound<'_, PyModule>) -> PyResult<()> {
@@ -238,7 +560,10 @@ fn _radish(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyVolumeMetadata>()?;
     m.add_class::<PySweepData>()?;
     m.add_class::<PyMomentData>()?;
+    m.add_class::<PyCfRadialFile>()?;
     m.add_function(wrap_pyfunction!(read_cfradial1, m)?)?;
     m.add_function(wrap_pyfunction!(scan_cfradial1, m)?)?;
+    m.add_function(wrap_pyfunction!(open_cfradial1, m)?)?;
+    m.add_function(wrap_pyfunction!(peek_conventions, m)?)?;
     Ok(())
 }
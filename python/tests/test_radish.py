@@ -15,6 +15,9 @@ def test_import():
     assert hasattr(radish, "VolumeMetadata")
     assert hasattr(radish, "SweepData")
     assert hasattr(radish, "MomentData")
+    assert hasattr(radish, "CfRadialFile")
+    assert hasattr(radish, "open_cfradial1")
+    assert hasattr(radish, "peek_conventions")
     assert hasattr(radish, "read_cfradial1")
     assert hasattr(radish, "scan_cfradial1")
 
@@ -50,6 +53,26 @@ def test_scan_cfradial1():
 
     assert isinstance(metadata, radish.VolumeMetadata)
     assert metadata.num_sweeps > 0
+    assert len(metadata.moment_names) > 0
+
+    # Only real moments, not 2D char variables such as sweep_mode
+    volume = radish.read_cfradial1("tests/data/test.nc")
+    sweep = volume.get_sweep(0)
+    assert sorted(metadata.moment_names) == sorted(sweep.moment_names())
+
+
+@pytest.mark.skip(reason="Requires test data")
+def test_open_cfradial1():
+    """Test scanning and reading through a single open file"""
+    with radish.open_cfradial1("tests/data/test.nc") as f:
+        metadata = f.metadata()
+        volume = f.read()
+
+    assert f.closed
+    assert volume.num_sweeps == metadata.num_sweeps
+
+    with pytest.raises(ValueError):
+        f.read()
 
 
 @pytest.mark.skip(reason="Requires test data")
@@ -59,6 +82,8 @@ def test_sweep_access():
     sweep = volume.get_sweep(0)
 
     assert isinstance(sweep, radish.SweepData)
+    assert isinstance(sweep.sweep_number, int)
+    assert isinstance(sweep.fixed_angle, float)
     assert sweep.num_rays > 0
     assert sweep.num_gates > 0
     assert len(sweep.moment_names()) > 0
@@ -84,6 +109,66 @@ def test_moment_access():
     assert data.ndim == 2
 
 
+@pytest.mark.skip(reason="Requires test data")
+def test_iter_moments():
+    """Test iterating moments with zero-copy data views"""
+    volume = radish.read_cfradial1("tests/data/test.nc")
+    sweep = volume.get_sweep(0)
+
+    moments = sweep.iter_moments()
+    assert [name for name, _ in moments] == sorted(sweep.moment_names())
+
+    for name, moment in moments:
+        view = moment.data_view()
+        assert not view.flags.writeable
+        np.testing.assert_array_equal(view, moment.data())
+
+
+@pytest.mark.skip(reason="Requires test data")
+def test_data_into():
+    """Test filling a preallocated buffer with moment data"""
+    volume = radish.read_cfradial1("tests/data/test.nc")
+    sweep = volume.get_sweep(0)
+
+    names = sweep.moment_names()
+    stack = np.empty((len(names), sweep.num_rays, sweep.num_gates), dtype=np.float32)
+    for i, name in enumerate(names):
+        sweep.get_moment(name).data_into(stack[i])
+        np.testing.assert_array_equal(stack[i], sweep.get_moment(name).data())
+
+    with pytest.raises(ValueError):
+        sweep.get_moment(names[0]).data_into(np.empty((1, 1), dtype=np.float32))
+
+
+@pytest.mark.skip(reason="Requires test data")
+def test_packed_moment():
+    """Test access to packed int16 moment data"""
+    volume = radish.read_cfradial1("tests/data/test.nc")
+    sweep = volume.get_sweep(0)
+
+    packed = [m for _, m in sweep.iter_moments() if m.is_packed]
+    assert packed
+
+    raw = packed[0].raw_data()
+    assert raw.dtype == np.int16
+    assert raw.shape == packed[0].shape
+
+
+@pytest.mark.skip(reason="Requires test data")
+def test_moments_dict():
+    """Test batched moment access"""
+    volume = radish.read_cfradial1("tests/data/test.nc")
+    sweep = volume.get_sweep(0)
+
+    moments = sweep.moments_dict()
+    assert sorted(moments) == sorted(sweep.moment_names())
+
+    for name, (data, units) in moments.items():
+        assert isinstance(data, np.ndarray)
+        assert data.shape == sweep.get_moment(name).shape
+        assert units == sweep.get_moment(name).units
+
+
 @pytest.mark.skip(reason="Requires test data and xarray")
 def test_xarray_backend():
     """Test xarray backend integration"""
@@ -98,3 +183,159 @@ def test_xarray_backend():
     assert "azimuth" in sweep_0.coords
     assert "elevation" in sweep_0.coords
     assert "range" in sweep_0.coords
+
+
+@pytest.mark.skip(reason="Requires test data and xarray")
+def test_xarray_coordinates_are_writable():
+    """Test that dataset coordinates are copies of the read-only sweep views"""
+    import xarray as xr
+
+    sweep = radish.read_cfradial1("tests/data/test.nc").get_sweep(0)
+    assert not sweep.azimuth.flags.writeable
+
+    ds = xr.open_dataset("tests/data/test.nc", engine="radish")
+    ds.azimuth.values[:] = 0
+    ds["elevation"] += 1
+
+
+@pytest.mark.skip(reason="Requires test data, xarray and dask")
+def test_xarray_chunks():
+    """Test that xarray chunking keeps whole rays together"""
+    import xarray as xr
+
+    ds = xr.open_dataset("tests/data/test.nc", engine="radish", chunks={"time": 100})
+
+    for var in ds.data_vars.values():
+        assert var.chunks is not None
+        assert var.chunksizes["range"] == (ds.sizes["range"],)
+
+
+def test_chunk_cache_kwargs_reach_reader(tmp_path):
+    """Test that chunk cache settings are validated by the Rust reader"""
+    with pytest.raises(RuntimeError, match="preemption"):
+        radish.read_cfradial1(tmp_path / "missing.nc", chunk_cache_w0=1.5)
+
+
+def test_guess_can_open_rejects_non_netcdf(tmp_path):
+    """Test that files without a netCDF signature are not claimed"""
+    from radish.backends import RadishBackendEntrypoint
+
+    path = tmp_path / "not_radar.nc"
+    path.write_bytes(b"plain text, not netCDF")
+
+    assert not RadishBackendEntrypoint.guess_can_open(path)
+    assert not RadishBackendEntrypoint.guess_can_open(tmp_path / "missing.nc")
+
+
+def test_guess_can_open_skips_urls():
+    """Test that URLs are left to engine="radish" instead of being fetched"""
+    from radish.backends import RadishBackendEntrypoint
+
+    assert not RadishBackendEntrypoint.guess_can_open("https://example.com/cfrad.nc")
+
+
+def test_volume_cache_size(monkeypatch):
+    """Test that a malformed RADISH_VOLUME_CACHE_SIZE falls back to the default"""
+    from radish.backends.xarray_backend import DEFAULT_VOLUME_CACHE_SIZE, _volume_cache_size
+
+    monkeypatch.setenv("RADISH_VOLUME_CACHE_SIZE", "0")
+    assert _volume_cache_size() == 0
+
+    monkeypatch.setenv("RADISH_VOLUME_CACHE_SIZE", "lots")
+    with pytest.warns(RuntimeWarning):
+        assert _volume_cache_size() == DEFAULT_VOLUME_CACHE_SIZE
+
+
+def test_normalize_path(tmp_path):
+    """Test that path-like objects resolve locally and URLs pass through"""
+    from radish.backends.xarray_backend import _normalize_path
+
+    assert _normalize_path(tmp_path / "radar.nc") == str(tmp_path / "radar.nc")
+    url = "https://example.com/data/cfrad.nc"
+    assert _normalize_path(url) == url
+
+
+def test_backend_array_indexing():
+    """Test that the backend array only returns the indexed region"""
+    pytest.importorskip("xarray")
+    from xarray.core import indexing
+    from radish.backends.xarray_backend import RadishBackendArray
+
+    array = np.arange(20, dtype=np.float32).reshape(4, 5)
+    lazy = indexing.LazilyIndexedArray(RadishBackendArray(array))
+    assert lazy.shape == (4, 5)
+    assert lazy.dtype == np.float32
+
+    subset = np.asarray(lazy[indexing.BasicIndexer((slice(1, 3), slice(None)))])
+    np.testing.assert_array_equal(subset, array[1:3])
+
+
+def test_backend_array_is_writable_after_load():
+    """Test that loaded moments can be edited without touching the shared buffer"""
+    xr = pytest.importorskip("xarray")
+    from xarray.core import indexing
+    from radish.backends.xarray_backend import MOMENT_DIMS, RadishBackendArray
+
+    array = np.arange(20, dtype=np.float32).reshape(4, 5)
+    array.flags.writeable = False
+    lazy = indexing.LazilyIndexedArray(RadishBackendArray(array))
+    ds = xr.Dataset({"VEL": xr.Variable(MOMENT_DIMS, lazy)}).load()
+
+    ds["VEL"][0, 0] = -1
+    ds["VEL"] += 1
+    ds["VEL"].values[1, :] = 0
+
+    assert ds["VEL"].values[0, 0] == 0
+    assert array[0, 0] == 0
+    assert array[1, 1] == 6
+
+
+def test_metadata_dataset_lists_moments():
+    """Test that the metadata-only dataset has a placeholder per moment"""
+    pytest.importorskip("xarray")
+    from types import SimpleNamespace
+    from radish.backends import RadishBackendEntrypoint
+
+    metadata = SimpleNamespace(
+        instrument_name="TEST_RADAR",
+        latitude=40.0,
+        longitude=-105.0,
+        altitude=1000.0,
+        sweep_fixed_angles=np.array([0.5, 1.5]),
+        moment_names=["DBZH", "VRADH"],
+    )
+    ds = RadishBackendEntrypoint()._create_metadata_dataset(metadata, {"VRADH"})
+
+    assert list(ds.data_vars) == ["sweep_fixed_angle", "DBZH"]
+    assert ds["DBZH"].dims == ("time", "range")
+    assert ds["DBZH"].size == 0
+
+
+@pytest.mark.skip(reason="Requires test data and xarray")
+def test_open_dataset_metadata_only():
+    """Test the metadata-only fast path through xarray"""
+    import xarray as xr
+
+    metadata = radish.scan_cfradial1("tests/data/test.nc")
+    ds = xr.open_dataset("tests/data/test.nc", engine="radish", metadata_only=True)
+
+    assert ds.attrs["instrument_name"] == metadata.instrument_name
+    assert sorted(set(ds.data_vars) - {"sweep_fixed_angle"}) == sorted(metadata.moment_names)
+
+
+def test_stats_nan_reductions():
+    """Test NaN-aware reductions against NumPy"""
+    from radish import stats
+
+    data = np.arange(20, dtype=np.float32).reshape(4, 5)
+    data[1, 2] = np.nan
+
+    assert stats.nanmax(data) == np.nanmax(data)
+    assert stats.nanmin(data) == np.nanmin(data)
+    assert stats.nanmean(data) == pytest.approx(np.nanmean(data))
+
+    # Empty and all-NaN input give NaN with or without numba
+    for values in (np.array([], dtype=np.float32), np.full(5, np.nan, dtype=np.float32)):
+        assert np.isnan(stats.nanmax(values))
+        assert np.isnan(stats.nanmin(values))
+        assert np.isnan(stats.nanmean(values))
@@ -9,20 +9,55 @@ use crate::{
     Result, RadishError,
     VolumeData, VolumeMetadata, SweepData, SweepMetadata, MomentData, Coordinates,
     backends::RadarBackend,
+    io::{ChunkCacheConfig, open_with_chunk_cache},
 };
+use netcdf::types::{BasicType, VariableType};
 use radish_types::{SweepMode, PlatformType};
 
 /// Backend for reading CfRadial1 format (CF/Radial NetCDF)
-pub struct CfRadial1Backend;
+pub struct CfRadial1Backend {
+    /// HDF5 chunk cache used when opening files
+    chunk_cache: ChunkCacheConfig,
+}
 
 impl CfRadial1Backend {
     /// Create a new CfRadial1Backend
     pub fn new() -> Self {
-        Self
+        Self {
+            chunk_cache: ChunkCacheConfig::default(),
+        }
+    }
+
+    /// Use the given HDF5 chunk cache settings when opening files
+    pub fn with_chunk_cache(mut self, chunk_cache: ChunkCacheConfig) -> Self {
+        self.chunk_cache = chunk_cache;
+        self
+    }
+
+    /// Open a file with this backend's chunk cache settings
+    pub fn open_file(&self, path: &Path) -> Result<netcdf::File> {
+        open_with_chunk_cache(path, &self.chunk_cache)
+    }
+
+    /// Read all sweeps of an open file whose metadata has already been read
+    pub fn read_volume_with_metadata(
+        &self,
+        file: &netcdf::File,
+        metadata: VolumeMetadata,
+    ) -> Result<VolumeData> {
+        let num_sweeps = metadata.sweep_group_names.len();
+
+        let mut sweeps = Vec::with_capacity(num_sweeps);
+        for i in 0..num_sweeps {
+            let sweep = self.read_sweep_data(file, i)?;
+            sweeps.push(sweep);
+        }
+
+        Ok(VolumeData::new(metadata, sweeps))
     }
 
     /// Read volume metadata from NetCDF file
-    fn read_volume_metadata(&self, file: &netcdf::File) -> Result<VolumeMetadata> {
+    pub fn read_volume_metadata(&self, file: &netcdf::File) -> Result<VolumeMetadata> {
         // Read required global attributes
         let instrument_name = read_string_attr(file, "instrument_name")
             .unwrap_or_else(|| "unknown".to_string());
@@ -76,6 +111,7 @@ impl CfRadial1Backend {
         metadata.altitude_agl = altitude_agl;
         metadata.sweep_group_names = sweep_group_names;
         metadata.sweep_fixed_angles = sweep_fixed_angle;
+        metadata.moment_names = moment_variable_names(file);
         metadata.frequency = frequency;
 
         Ok(metadata)
@@ -106,40 +142,22 @@ impl CfRadial1Backend {
             fixed_angle[sweep_idx],
         );
 
-        // Read coordinates
-        let time = read_var_1d::<f64>(file, "time")?;
+        // Read coordinates; per-ray coordinates are read for this sweep's rays only,
+        // straight into their own contiguous vectors
+        let time = read_var_1d_slice::<f64>(file, "time", start_idx, num_rays)?;
         let range = read_var_1d::<f32>(file, "range")?;
-        let azimuth = read_var_1d::<f32>(file, "azimuth")?;
-        let elevation = read_var_1d::<f32>(file, "elevation")?;
-
-        let coordinates = Coordinates::new(
-            time[start_idx..=end_idx].to_vec(),
-            range.clone(),
-            azimuth[start_idx..=end_idx].to_vec(),
-            elevation[start_idx..=end_idx].to_vec(),
-        );
+        let azimuth = read_var_1d_slice::<f32>(file, "azimuth", start_idx, num_rays)?;
+        let elevation = read_var_1d_slice::<f32>(file, "elevation", start_idx, num_rays)?;
+        let num_gates = range.len();
+
+        let coordinates = Coordinates::new(time, range, azimuth, elevation);
 
         // Read moment data
         let mut moments = HashMap::new();
 
-        // Get list of variables
-        let var_names = file.variables()
-            .map(|v| v.name())
-            .collect::<Vec<_>>();
-
-        for var_name in var_names {
-            // Skip coordinate variables
-            if ["time", "range", "azimuth", "elevation"].contains(&var_name.as_str()) {
-                continue;
-            }
-
-            if let Ok(var) = file.variable(&var_name) {
-                // Check if it's a 2D moment variable [time, range]
-                if var.dimensions().len() == 2 {
-                    if let Ok(moment) = self.read_moment(file, &var_name, start_idx, end_idx, range.len()) {
-                        moments.insert(var_name, moment);
-                    }
-                }
+        for var_name in moment_variable_names(file) {
+            if let Ok(moment) = self.read_moment(file, &var_name, start_idx, end_idx, num_gates) {
+                moments.insert(var_name, moment);
             }
         }
 
@@ -177,26 +195,10 @@ impl CfRadial1Backend {
             })
             .unwrap_or_else(|| "unknown".to_string());
 
-        let fill_value = var.attribute("_FillValue")
-            .and_then(|a| a.value().ok())
-            .and_then(|v| match v {
-                netcdf::AttrValue::Float(f) => Some(f),
-                _ => None,
-            });
-
-        let scale_factor = var.attribute("scale_factor")
-            .and_then(|a| a.value().ok())
-            .and_then(|v| match v {
-                netcdf::AttrValue::Float(f) => Some(f),
-                _ => None,
-            });
-
-        let add_offset = var.attribute("add_offset")
-            .and_then(|a| a.value().ok())
-            .and_then(|v| match v {
-                netcdf::AttrValue::Float(f) => Some(f),
-                _ => None,
-            });
+        // Packed moments are usually int16 with _FillValue stored as a short
+        let fill_value = read_f32_attr(&var, "_FillValue");
+        let scale_factor = read_f32_attr(&var, "scale_factor");
+        let add_offset = read_f32_attr(&var, "add_offset");
 
         let standard_name = var.attribute("standard_name")
             .and_then(|a| a.value().ok())
@@ -237,30 +239,21 @@ impl RadarBackend for CfRadial1Backend {
     }
 
     fn scan_file(&self, path: &Path) -> Result<VolumeMetadata> {
-        let file = netcdf::open(path)?;
+        let file = self.open_file(path)?;
         self.read_volume_metadata(&file)
     }
 
     fn read_sweep(&self, path: &Path, sweep_idx: usize) -> Result<SweepData> {
-        let file = netcdf::open(path)?;
+        let file = self.open_file(path)?;
         self.read_sweep_data(&file, sweep_idx)
     }
 
     fn read_volume(&self, path: &Path) -> Result<VolumeData> {
-        let file = netcdf::open(path)?;
+        let file = self.open_file(path)?;
 
-        // Read metadata
+        // Read metadata, then all sweeps
         let metadata = self.read_volume_metadata(&file)?;
-        let num_sweeps = metadata.sweep_group_names.len();
-
-        // Read all sweeps
-        let mut sweeps = Vec::with_capacity(num_sweeps);
-        for i in 0..num_sweeps {
-            let sweep = self.read_sweep_data(&file, i)?;
-            sweeps.push(sweep);
-        }
-
-        Ok(VolumeData::new(metadata, sweeps))
+        self.read_volume_with_metadata(&file, metadata)
     }
 }
 
@@ -272,6 +265,24 @@ impl Default for CfRadial1Backend {
 
 // Helper functions
 
+/// Names of the numeric [time, range] moment variables in a file
+///
+/// Other 2D variables such as sweep_mode (sweep, string_length) are char
+/// arrays and not moments.
+fn moment_variable_names(file: &netcdf::File) -> Vec<String> {
+    file.variables()
+        .filter(|var| {
+            let dims: Vec<String> = var.dimensions().iter().map(|d| d.name()).collect();
+            dims == ["time", "range"]
+        })
+        .filter(|var| match var.vartype() {
+            VariableType::Basic(basic) => !matches!(basic, BasicType::Char),
+            _ => false,
+        })
+        .map(|var| var.name())
+        .collect()
+}
+
 fn read_string_attr(file: &netcdf::File, name: &str) -> Option<String> {
     file.attribute(name)
         .and_then(|a| a.value().ok())
@@ -282,6 +293,18 @@ fn read_string_attr(file: &netcdf::File, name: &str) -> Option<String> {
         })
 }
 
+fn read_f32_attr(var: &netcdf::Variable, name: &str) -> Option<f32> {
+    var.attribute(name)
+        .and_then(|a| a.value().ok())
+        .and_then(|v| match v {
+            netcdf::AttrValue::Short(s) => Some(s as f32),
+            netcdf::AttrValue::Int(i) => Some(i as f32),
+            netcdf::AttrValue::Float(f) => Some(f),
+            netcdf::AttrValue::Double(d) => Some(d as f32),
+            _ => None,
+        })
+}
+
 fn read_scalar_var<T: netcdf::Numeric>(file: &netcdf::File, name: &str) -> Result<T> {
     let var = file.variable(name)
         .ok_or_else(|| RadishError::MissingVariable(name.to_string()))?;
@@ -302,6 +325,21 @@ fn read_var_1d<T: netcdf::Numeric>(file: &netcdf::File, name: &str) -> Result<Ve
     Ok(data)
 }
 
+fn read_var_1d_slice<T: netcdf::Numeric>(
+    file: &netcdf::File,
+    name: &str,
+    start: usize,
+    count: usize,
+) -> Result<Vec<T>> {
+    let var = file.variable(name)
+        .ok_or_else(|| RadishError::MissingVariable(name.to_string()))?;
+
+    let data: Vec<T> = var.get((start,), (count,))
+        .map_err(|e| RadishError::NetCdf(e))?;
+
+    Ok(data)
+}
+
 fn read_var_1d_str(file: &netcdf::File, name: &str) -> Result<Vec<String>> {
     let var = file.variable(name)
         .ok_or_else(|| RadishError::MissingVariable(name.to_string()))?;
@@ -1,7 +1,143 @@
 /// NetCDF utilities for reading radar data
 
+use std::path::{Path, PathBuf};
+use std::sync::{Mutex, MutexGuard};
+
 use crate::{Result, RadishError};
 
+/// URL schemes read remotely rather than from the local filesystem
+const REMOTE_SCHEMES: &[&str] = &["http://", "https://"];
+
+/// Serializes opens so a temporarily changed chunk cache default never leaks
+/// into another file opened at the same time
+static OPEN_LOCK: Mutex<()> = Mutex::new(());
+
+fn open_lock() -> MutexGuard<'static, ()> {
+    OPEN_LOCK.lock().unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+/// Where a file is read from
+#[derive(Debug, Clone, PartialEq)]
+pub enum Source {
+    /// File on the local filesystem
+    Local(PathBuf),
+    /// Remote URL, read with HTTP byte-range requests
+    Remote(String),
+}
+
+impl Source {
+    /// Classify a path, treating http(s) URLs as remote
+    pub fn from_path(path: &Path) -> Self {
+        match path.to_str() {
+            Some(s) if REMOTE_SCHEMES.iter().any(|scheme| s.starts_with(scheme)) => {
+                Source::Remote(s.to_string())
+            }
+            _ => Source::Local(path.to_path_buf()),
+        }
+    }
+
+    /// Path to hand to libnetcdf
+    ///
+    /// Remote URLs get netcdf-c's "#mode=bytes" so only the byte ranges that
+    /// are actually needed are fetched, instead of downloading the whole file.
+    pub fn netcdf_path(&self) -> PathBuf {
+        match self {
+            Source::Local(path) => path.clone(),
+            Source::Remote(url) if url.contains("#mode=") => PathBuf::from(url),
+            Source::Remote(url) => PathBuf::from(format!("{}#mode=bytes", url)),
+        }
+    }
+}
+
+/// Open a local file or remote URL with the library's default chunk cache
+pub fn open(path: &Path) -> Result<netcdf::File> {
+    let _guard = open_lock();
+    Ok(netcdf::open(Source::from_path(path).netcdf_path())?)
+}
+
+/// HDF5 chunk cache settings used when opening a file
+///
+/// netcdf-c gives every variable its own cache of this size. The HDF5
+/// default (1 MiB) is far smaller than a typical radar moment, so every ray
+/// read can evict the chunks the next ray needs.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct ChunkCacheConfig {
+    /// Cache size in bytes
+    pub nbytes: usize,
+    /// Number of hash table slots (ideally a prime)
+    pub nslots: usize,
+    /// Preemption policy between 0 and 1
+    pub w0: f32,
+}
+
+impl Default for ChunkCacheConfig {
+    fn default() -> Self {
+        Self {
+            nbytes: 64 * 1024 * 1024,
+            nslots: 10007,
+            w0: 0.75,
+        }
+    }
+}
+
+/// Open a local file or remote URL with the given chunk cache settings
+pub fn open_with_chunk_cache(path: &Path, cache: &ChunkCacheConfig) -> Result<netcdf::File> {
+    if !(0.0..=1.0).contains(&cache.w0) {
+        return Err(RadishError::General(format!(
+            "Chunk cache preemption must be between 0 and 1, got {}",
+            cache.w0
+        )));
+    }
+
+    let _guard = open_lock();
+
+    // Variables take their cache settings from the library-wide default when
+    // the file is opened, so swap it in for this open only
+    let previous = get_chunk_cache()?;
+    set_chunk_cache(cache)?;
+
+    let file = netcdf::open(Source::from_path(path).netcdf_path());
+    set_chunk_cache(&previous)?;
+
+    Ok(file?)
+}
+
+fn get_chunk_cache() -> Result<ChunkCacheConfig> {
+    let mut cache = ChunkCacheConfig::default();
+    let status = {
+        let _guard = libnetcdf_lock();
+        unsafe {
+            netcdf_sys::nc_get_chunk_cache(&mut cache.nbytes, &mut cache.nslots, &mut cache.w0)
+        }
+    };
+    check_chunk_cache_status(status, "get")?;
+    Ok(cache)
+}
+
+fn set_chunk_cache(cache: &ChunkCacheConfig) -> Result<()> {
+    let status = {
+        let _guard = libnetcdf_lock();
+        unsafe { netcdf_sys::nc_set_chunk_cache(cache.nbytes, cache.nslots, cache.w0) }
+    };
+    check_chunk_cache_status(status, "set")
+}
+
+fn libnetcdf_lock() -> MutexGuard<'static, ()> {
+    netcdf_sys::libnetcdf_lock
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+fn check_chunk_cache_status(status: i32, action: &str) -> Result<()> {
+    if status != netcdf_sys::NC_NOERR {
+        return Err(RadishError::General(format!(
+            "Failed to {} chunk cache (status {})",
+            action, status
+        )));
+    }
+    Ok(())
+}
+
 /// Read a string attribute from a NetCDF file or variable
 pub fn read_string_attribute(
     attrs: impl Iterator<Item = netcdf::Attribute>,
@@ -32,3 +168,65 @@ pub fn read_numeric_attribute<T: netcdf::Numeric>(
             _ => None,
         })
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_source_local_path() {
+        let source = Source::from_path(Path::new("data/cfrad.nc"));
+        assert_eq!(source, Source::Local(PathBuf::from("data/cfrad.nc")));
+        assert_eq!(source.netcdf_path(), PathBuf::from("data/cfrad.nc"));
+    }
+
+    #[test]
+    fn test_source_remote_url() {
+        let source = Source::from_path(Path::new("https://example.com/cfrad.nc"));
+        assert_eq!(source, Source::Remote("https://example.com/cfrad.nc".to_string()));
+        assert_eq!(
+            source.netcdf_path(),
+            PathBuf::from("https://example.com/cfrad.nc#mode=bytes")
+        );
+    }
+
+    #[test]
+    fn test_source_remote_url_with_mode() {
+        let url = "http://example.com/cfrad.nc#mode=bytes,s3";
+        let source = Source::from_path(Path::new(url));
+        assert_eq!(source, Source::Remote(url.to_string()));
+        assert_eq!(source.netcdf_path(), PathBuf::from(url));
+    }
+
+    #[test]
+    fn test_open_with_chunk_cache_restores_default() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("cache.nc");
+        {
+            let mut file = netcdf::create(&path).unwrap();
+            file.add_dimension("time", 4).unwrap();
+            file.add_variable::<f32>("DBZH", &["time"]).unwrap();
+        }
+
+        let before = get_chunk_cache().unwrap();
+        let cache = ChunkCacheConfig {
+            nbytes: before.nbytes + 1024 * 1024,
+            nslots: 521,
+            w0: 0.5,
+        };
+
+        let file = open_with_chunk_cache(&path, &cache).unwrap();
+        assert!(file.variable("DBZH").is_some());
+        assert_eq!(get_chunk_cache().unwrap(), before);
+    }
+
+    #[test]
+    fn test_open_with_chunk_cache_rejects_bad_preemption() {
+        let cache = ChunkCacheConfig {
+            w0: 1.5,
+            ..ChunkCacheConfig::default()
+        };
+        let result = open_with_chunk_cache(Path::new("missing.nc"), &cache);
+        assert!(matches!(result, Err(RadishError::General(_))));
+    }
+}
@@ -87,6 +87,9 @@ pub struct VolumeMetadata {
     /// Fixed angles for each sweep (degrees)
     pub sweep_fixed_angles: Vec<f64>,
 
+    /// Names of the moments stored in the file
+    pub moment_names: Vec<String>,
+
     /// Radar frequency (Hz)
     pub frequency: Option<f64>,
 
@@ -118,6 +121,7 @@ impl VolumeMetadata {
             time_coverage_end,
             sweep_group_names: Vec::new(),
             sweep_fixed_angles: Vec::new(),
+            moment_names: Vec::new(),
             frequency: None,
             attributes: std::collections::HashMap::new(),
         }